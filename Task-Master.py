@@ -1,70 +1,202 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from tkcalendar import DateEntry
 from datetime import datetime, timedelta
 import logging
-import firebase_admin
-from firebase_admin import credentials, db
-import configparser
-import re
+import concurrent.futures
+from collections import OrderedDict, deque
+from operator import itemgetter
+import json
 import os
-from dotenv import load_dotenv
+import sys
+import time
+import uuid
 
-load_dotenv()
+try:
+    import orjson  # Optional; only used to read and write the local task cache faster
+except ImportError:
+    orjson = None
 
-FIREBASE_DATABASE_URL = os.getenv("FIREBASE_DATABASE_URL")
-
-# Initialize Firebase app with credentials
-cred = credentials.Certificate('credentials.json')
-firebase_admin.initialize_app(cred, {
-    'databaseURL': FIREBASE_DATABASE_URL
-})
+# Firebase database module, set once the app has been initialised
+_firebase_db = None
 
 # Configure logging
 logging.basicConfig(filename='Task-Master.log', level=logging.INFO, filemode='a')  # Append to the log file
 
+# Delay before queued database updates are flushed, so bursts of edits are sent as one write
+SAVE_DELAY_MS = 200
 
-def read_username_from_config():
+# Interval for checking whether background database work has finished
+POLL_INTERVAL_MS = 50
+
+# Number of treeview rows inserted per idle callback when the whole tree is rebuilt
+TREE_BATCH_SIZE = 200
+
+# Deadline time strings in 30-minute intervals, built once rather than per window
+TIME_STRINGS = tuple(f'{hour:02d}:{minute:02d}' for hour in range(24) for minute in (0, 30))
+
+# Task statuses; statuses read from the database or the status box are interned, so comparing them with these
+# constants hits the identity fast path instead of comparing characters
+STATUS_TO_DO = sys.intern('To Do')
+STATUS_IN_PROGRESS = sys.intern('In Progress')
+STATUS_COMPLETE = sys.intern('Complete')
+
+# Format deadlines are stored and displayed in
+DEADLINE_FORMAT = '%Y-%m-%d %H:%M'
+
+# Placeholder the database replaces with its own time, so updated_at is comparable across devices
+SERVER_TIMESTAMP = {'.sv': 'timestamp'}
+
+
+def get_firebase_db():
+    # Import and initialise Firebase on first use rather than at startup, so the windows don't wait for it
+    global _firebase_db
+    if _firebase_db is None:
+        import firebase_admin
+        from firebase_admin import credentials, db
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+        # Initialize Firebase app with credentials
+        cred = credentials.Certificate('credentials.json')
+        firebase_admin.initialize_app(cred, {
+            'databaseURL': os.getenv("FIREBASE_DATABASE_URL")
+        })
+        _firebase_db = db
+    return _firebase_db
+
+
+CONFIG_FILE = 'config.json'
+LEGACY_CONFIG_FILE = 'config.ini'
+
+# Loaded config and the modification time of the file it was read from
+_config_cache = {'mtime': None, 'config': None}
+
+
+def load_legacy_config():
+    # Older versions stored the username in config.ini; carry it over until config.json is first written
+    import configparser
     config = configparser.ConfigParser()
-    config_file = 'config.ini'
-    if os.path.isfile(config_file):
-        config.read(config_file)
-        try:
-            username = config.get('user', 'username')
-            return username
-        except configparser.Error:
-            return ''
-    else:
-        return ''
+    try:
+        config.read(LEGACY_CONFIG_FILE)
+    except configparser.Error:
+        return {}
+    return {'username': config.get('user', 'username', fallback='')}
+
+
+def load_config():
+    # Only re-read the config file if it has changed since it was last read
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime
+    except OSError:
+        mtime = None
+    if _config_cache['config'] is None or mtime != _config_cache['mtime']:
+        config = {}
+        if mtime is not None:
+            try:
+                with open(CONFIG_FILE) as file:
+                    config = json.load(file)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable config file: {e}")
+            if not isinstance(config, dict):
+                config = {}
+        elif os.path.exists(LEGACY_CONFIG_FILE):
+            config = load_legacy_config()
+        _config_cache['mtime'] = mtime
+        _config_cache['config'] = config
+    return _config_cache['config']
+
+
+def read_username_from_config():
+    return load_config().get('username', '')
 
 
 def write_username_to_config(username):
-    config = configparser.ConfigParser()
-    config_file = 'config.ini'
-    config.read(config_file)
+    config = dict(load_config(), username=username)
+
+    # Write to a temporary file first so a crash can't leave a half-written config behind
+    temp_file = f'{CONFIG_FILE}.tmp'
+    with open(temp_file, 'w') as file:
+        json.dump(config, file)
+    os.replace(temp_file, CONFIG_FILE)
+    _config_cache['mtime'] = os.stat(CONFIG_FILE).st_mtime
+    _config_cache['config'] = config
+
+
+def parse_deadline(text):
+    # Deadlines are parsed once when tasks are loaded and kept as datetimes from then on
+    if not text:
+        return None
+    if not isinstance(text, str):  # e.g. a number in a hand-edited node
+        logging.warning(f"Ignoring unrecognised deadline {text!r}")
+        return None
+    try:
+        date_text, _, time_text = text.partition(' ')
+        if time_text == '24:00':
+            # Older versions offered 24:00, which datetime can't represent; it is midnight the next day
+            return datetime.strptime(date_text, '%Y-%m-%d') + timedelta(days=1)
+        try:
+            # Deadlines saved by this version are ISO formatted, which fromisoformat parses much faster than strptime
+            return datetime.fromisoformat(text)
+        except ValueError:
+            # Older versions saved the time as typed, e.g. '9:30', which only strptime accepts
+            return datetime.strptime(text, DEADLINE_FORMAT)
+    except ValueError:
+        logging.warning(f"Ignoring unrecognised deadline {text!r}")
+        return None
+
+
+def format_deadline(deadline):
+    return deadline.isoformat(sep=' ', timespec='minutes') if deadline else ''
 
-    # Create the [user] section if it doesn't exist
-    if not config.has_section('user'):
-        config.add_section('user')
 
-    config.set('user', 'username', username)
-    with open(config_file, 'w') as file:
-        config.write(file)
+def new_task_key():
+    # Like a Firebase push() key, this sorts chronologically so the database returns tasks in creation order,
+    # but it is generated locally instead of costing a round trip to the server
+    return f"{time.time_ns():016x}{uuid.uuid4().hex[:8]}"
 
 
 class Task:
-    def __init__(self, name, deadline, status, order=0):
+    __slots__ = ('key', 'name', 'deadline', 'status', 'order')
+
+    def __init__(self, name, deadline, status, order=0, key=None):
+        self.key = key or new_task_key()  # Stable database key, independent of the task name
         self.name = name
         self.deadline = deadline
         self.status = status
         self.order = order
 
+    def to_dict(self):
+        return {'name': self.name, 'deadline': format_deadline(self.deadline), 'status': self.status, 'order': self.order}
+
+
+def build_tasks(tasks_data, presorted=False):
+    # Build the ordered task dict from stored {task key: task data} mappings; presorted data is already in display order
+    # Extract the required fields in one call per task; order defaults to 0 if it doesn't exist
+    get_fields = itemgetter('name', 'deadline', 'status')
+    tasks = []
+    for task_id, task_data in (tasks_data or {}).items():
+        try:
+            name, deadline, status = get_fields(task_data)
+            status = sys.intern(status)  # Raises TypeError for a non-string status, e.g. a hand-edited node
+        except (KeyError, TypeError):
+            # A field update to a task deleted on another device leaves a node without a name; skip it, and any
+            # other malformed node, rather than fail the whole load
+            logging.warning(f"Ignoring incomplete task {task_id!r}: {task_data!r}")
+            continue
+        tasks.append(Task(name, parse_deadline(deadline), status, task_data.get('order', 0), task_id))
+
+    if not presorted:
+        tasks.sort(key=lambda x: x.order)  # Sort tasks based on order
+    return OrderedDict((task.key, task) for task in tasks)
+
 
-class LoginScreen(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Task-Master - Login")
-        self.geometry("300x150")
+class LoginScreen(ttk.Frame):
+    def __init__(self, master):
+        super().__init__(master)
+        self.master.title("Task-Master - Login")
+        self.master.geometry("300x150")
+        self.pack(fill="both", expand=True)
 
         self.username = read_username_from_config()
         if self.username:
@@ -86,15 +218,18 @@ class LoginScreen(tk.Tk):
         username = self.username_entry.get().strip()  # Remove leading/trailing whitespaces
         if username:
             write_username_to_config(username)
+            self.username = username
             self.open_task_manager()
         else:
             messagebox.showerror("Error", "Please enter a username.")
 
     def open_task_manager(self):
+        # Swap the login frame for the task manager in the same root window, rather than
+        # destroying it and starting a second Tcl interpreter
+        master = self.master
         self.destroy()
-        root = tk.Tk()
-        app = TaskManager(root, self.username)
-        root.mainloop()
+        master.geometry("")  # Let the window size itself to the task manager
+        TaskManager(master, self.username)
 
 
 class TaskManager:
@@ -102,10 +237,37 @@ class TaskManager:
         self.master = master
         self.master.title("Task-Master")
         self.username = username
-        self.tasks = self.load_tasks_from_database()
+        self.tasks_ref = None  # Created on the worker thread, then reused for every database call
+        self.cache_file = f'tasks_cache_{self.username}.json'  # Local copy of the tasks for instant startup
+        # Task key -> Task in display order; treeview rows use the task key as their item id,
+        # so rows resolve to tasks without reading their values back
+        self.tasks = OrderedDict()
+        self.pending_rows = deque()  # Keys of tasks still waiting to be inserted into the treeview
+        self.row_values = {}  # Task key -> values last written to its treeview row
+        self.pending_updates = {}  # Database paths waiting to be flushed
+        self.flush_job = None
+        self.unsynced_keys = set()  # Keys of tasks changed while the initial load is in flight
+        self.save_failed = False  # Set on the worker thread once a database save fails
+        self.closing = False
+
+        # Database calls run on a single worker thread so the UI never waits on the network
+        # and writes reach the database in the order they were made
+        self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
         self.setup_ui()
 
+        # Show the cached tasks straight away, then refresh them from the database in the background
+        cached_data, self.synced_at = self.load_tasks_from_cache()
+        self.tasks = build_tasks(cached_data, presorted=True)  # The cache is written in display order
+        self.update_task_tree()
+        self.run_in_background(self.load_tasks_from_database, self.on_tasks_loaded, cached_data, self.synced_at)
+
+        # Flush any pending database updates before the window closes
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def setup_ui(self):
+        from tkcalendar import DateEntry  # Only needed once the task manager opens
+
         # Create main frame
         main_frame = ttk.Frame(self.master, padding=(10, 10))
         main_frame.grid(row=0, column=0, sticky="nsew")
@@ -130,14 +292,13 @@ class TaskManager:
         self.deadline_time_label = ttk.Label(task_frame, text="Deadline Time:")
         self.deadline_time_label.grid(row=0, column=4, padx=5, pady=5, sticky="w")
 
-        self.deadline_entry_time = ttk.Combobox(task_frame, width=10)
+        self.deadline_entry_time = ttk.Combobox(task_frame, width=10, values=TIME_STRINGS)
         self.deadline_entry_time.grid(row=0, column=5, padx=5, pady=5)
-        self.populate_time_combobox()
 
         self.status_label = ttk.Label(task_frame, text="Status:")
         self.status_label.grid(row=0, column=6, padx=5, pady=5, sticky="w")
 
-        self.status_combobox = ttk.Combobox(task_frame, values=["To Do", "In Progress"])
+        self.status_combobox = ttk.Combobox(task_frame, values=[STATUS_TO_DO, STATUS_IN_PROGRESS])
         self.status_combobox.grid(row=0, column=7, padx=5, pady=5)
 
         self.add_button = ttk.Button(task_frame, text="Add Task", command=self.add_task)
@@ -153,7 +314,8 @@ class TaskManager:
         self.task_tree.heading("Status", text="Status")
         self.task_tree.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
 
-        # Add tooltips
+        # Add tooltips; every widget shares a single tooltip window
+        self.tooltip = ToolTip(self.master)
         self.create_tooltip(self.task_entry, "Enter task name")
         self.create_tooltip(self.deadline_entry_date, "Select deadline date")
         self.create_tooltip(self.deadline_entry_time, "Select deadline time")
@@ -163,18 +325,23 @@ class TaskManager:
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=2, column=0, padx=5, pady=5, sticky="nsew")
 
-        self.complete_button = ttk.Button(button_frame, text="Mark Complete", command=self.mark_complete)
+        self.complete_button = ttk.Button(button_frame, text="Mark Complete", command=lambda: self.set_status(STATUS_COMPLETE))
         self.complete_button.grid(row=0, column=0, padx=5, pady=5)
 
-        self.in_progress_button = ttk.Button(button_frame, text="Mark In Progress", command=self.mark_in_progress)
+        self.in_progress_button = ttk.Button(button_frame, text="Mark In Progress", command=lambda: self.set_status(STATUS_IN_PROGRESS))
         self.in_progress_button.grid(row=0, column=1, padx=5, pady=5)
 
-        self.to_do_button = ttk.Button(button_frame, text="Mark To Do", command=self.mark_to_do)
+        self.to_do_button = ttk.Button(button_frame, text="Mark To Do", command=lambda: self.set_status(STATUS_TO_DO))
         self.to_do_button.grid(row=0, column=2, padx=5, pady=5)
 
         self.delete_button = ttk.Button(button_frame, text="Delete Selected", command=self.delete_selected)
         self.delete_button.grid(row=0, column=3, padx=5, pady=5)
 
+        # Create the right-click menu once and reuse it for every click
+        self.context_menu = tk.Menu(self.master, tearoff=0)
+        self.context_menu.add_command(label="Prioritise Task", command=self.prioritise_context_item)
+        self.context_menu_item = None
+
         # Bind right-click event to the task treeview
         self.task_tree.bind("<Button-3>", self.right_click_menu)
 
@@ -186,29 +353,12 @@ class TaskManager:
         self.master.rowconfigure(0, weight=1)
         self.master.columnconfigure(0, weight=1)
 
-        # Load tasks into the treeview
-        self.update_task_tree()
-
     def create_tooltip(self, widget, text):
         """Create a tooltip for a widget"""
-        tooltip = ToolTip(widget, text)
-        widget.bind("<Enter>", lambda _: tooltip.showtip())
-        widget.bind("<Leave>", lambda _: tooltip.hidetip())
-
-    def populate_time_combobox(self):
-        # Define the static time strings in 30-minute intervals
-        time_strings = [
-            '00:00', '00:30', '01:00', '01:30', '02:00', '02:30', '03:00', '03:30',
-            '04:00', '04:30', '05:00', '05:30', '06:00', '06:30', '07:00', '07:30',
-            '08:00', '08:30', '09:00', '09:30', '10:00', '10:30', '11:00', '11:30',
-            '12:00', '12:30', '13:00', '13:30', '14:00', '14:30', '15:00', '15:30',
-            '16:00', '16:30', '17:00', '17:30', '18:00', '18:30', '19:00', '19:30',
-            '20:00', '20:30', '21:00', '21:30', '22:00', '22:30', '23:00', '23:30', '24:00'
-        ]
-        self.deadline_entry_time['values'] = time_strings
-
+        self.tooltip.add_widget(widget, text)
 
     def validate_input(self):
+        # Returns the validated deadline, or None if any input is invalid
         task_name = self.task_entry.get().strip()
         deadline_date = self.deadline_entry_date.get()
         deadline_time = self.deadline_entry_time.get()
@@ -216,63 +366,77 @@ class TaskManager:
 
         if not task_name:
             messagebox.showerror("Error", "Please enter a task name.")
-            return False
+            return None
 
         if not deadline_date or not deadline_time:
             messagebox.showerror("Error", "Please enter a deadline date and time.")
-            return False
+            return None
+
+        # Parse the deadline once here, so callers can use it directly
+        try:
+            deadline = datetime.strptime(f"{deadline_date} {deadline_time}", DEADLINE_FORMAT)
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid deadline date and time (HH:MM).")
+            return None
 
         if not status:
             messagebox.showerror("Error", "Please select a status.")
-            return False
+            return None
 
-        return True
+        return deadline
 
     def add_task(self):
-        if self.validate_input():
+        deadline = self.validate_input()
+        if deadline:
             task_name = self.task_entry.get().strip()
-            deadline_date = self.deadline_entry_date.get()
-            deadline_time = self.deadline_entry_time.get()
-            status = self.status_combobox.get()
-            deadline = f"{deadline_date} {deadline_time}"
-            task = Task(task_name, deadline, status)
-            self.tasks.append(task)
-            try:
-                self.save_tasks_to_database()  # Save tasks to the database
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save tasks to the database: {e}")
-            self.update_task_tree()
+            status = sys.intern(self.status_combobox.get())
+            # Order the new task after the current last task
+            order = next(reversed(self.tasks.values())).order + 1 if self.tasks else 0
+            task = Task(task_name, deadline, status, order)
+            self.tasks[task.key] = task
+            self.queue_database_update({task.key: task.to_dict()})  # Save the new task to the database
+            if self.pending_rows:
+                self.pending_rows.append(task.key)  # The treeview is still being populated; add it after the rest
+            else:
+                self.insert_task_row(task)
             self.clear_task_entry()
 
     def edit_task(self):
         selected_item = self.task_tree.selection()
         if selected_item:
-            item = self.task_tree.item(selected_item)
-            task_name = item['values'][0]
-            deadline = item['values'][1]
-            status = item['values'][2]
-
             # Find the task object
-            task = next((t for t in self.tasks if t.name == task_name and t.deadline == deadline and t.status == status), None)
+            task = self.tasks.get(selected_item[0])
 
             if task:
                 self.task_entry.delete(0, tk.END)
                 self.task_entry.insert(0, task.name)
-                self.deadline_entry_date.set_date(datetime.strptime(task.deadline.split()[0], '%Y-%m-%d').date())
-                self.deadline_entry_time.set(task.deadline.split()[1])
+                if task.deadline:
+                    self.deadline_entry_date.set_date(task.deadline.date())
+                    self.deadline_entry_time.set(task.deadline.strftime('%H:%M'))
+                else:
+                    self.deadline_entry_date.set_date(datetime.today())
+                    self.deadline_entry_time.set('')
                 self.status_combobox.set(task.status)
 
-                # Save the edited task details
+                # Save the edited task details; look the task up again by key, since the background load can
+                # replace self.tasks with new Task objects while the edit is open
+                key = task.key
+
                 def save_edited_task():
-                    if self.validate_input():
+                    task = self.tasks.get(key)
+                    if not task:
+                        # The task was deleted while it was being edited; don't write it back to the database
+                        self.clear_task_entry()
+                        self.add_button.config(text="Add Task", command=self.add_task)
+                        messagebox.showwarning("Warning", "The task being edited has been deleted.")
+                        return
+                    deadline = self.validate_input()
+                    if deadline:
                         task.name = self.task_entry.get().strip()
-                        task.deadline = f"{self.deadline_entry_date.get()} {self.deadline_entry_time.get()}"
-                        task.status = self.status_combobox.get()
-                        try:
-                            self.save_tasks_to_database()
-                        except Exception as e:
-                            messagebox.showerror("Error", f"Failed to save tasks to the database: {e}")
-                        self.update_task_tree()
+                        task.deadline = deadline
+                        task.status = sys.intern(self.status_combobox.get())
+                        self.queue_database_update({task.key: task.to_dict()})
+                        self.refresh_task_row(task)
                         self.clear_task_entry()
                         self.add_button.config(text="Add Task", command=self.add_task)  # Reset button text and command
 
@@ -282,147 +446,292 @@ class TaskManager:
         else:
             messagebox.showwarning("Warning", "Please select a task to edit.")
 
-    def mark_complete(self):
-        selected_item = self.task_tree.selection()
-        if selected_item:
-            item = self.task_tree.item(selected_item)
-            task_name = item['values'][0]
-            deadline = item['values'][1]
-
-            # Change status to "Complete"
-            for task in self.tasks:
-                if task.name == task_name and task.deadline == deadline:
-                    task.status = "Complete"
-                    break
-
-            self.save_tasks_to_database()  # Save updated tasks to the database
-            self.update_task_tree()
-        else:
-            messagebox.showwarning("Warning", "Please select a task to mark complete.")
-
-    def mark_in_progress(self):
-        selected_item = self.task_tree.selection()
-        if selected_item:
-            item = self.task_tree.item(selected_item)
-            task_name = item['values'][0]
-            deadline = item['values'][1]
-
-            # Change status to "In Progress"
-            for task in self.tasks:
-                if task.name == task_name and task.deadline == deadline:
-                    task.status = "In Progress"
-                    break
-
-            self.save_tasks_to_database()  # Save updated tasks to the database
-            self.update_task_tree()
-        else:
-            messagebox.showwarning("Warning", "Please select a task to mark in progress.")
-
-    def mark_to_do(self):
+    def set_status(self, status):
         selected_item = self.task_tree.selection()
         if selected_item:
-            item = self.task_tree.item(selected_item)
-            task_name = item['values'][0]
-            deadline = item['values'][1]
-
-            # Change status to "To Do"
-            for task in self.tasks:
-                if task.name == task_name and task.deadline == deadline:
-                    task.status = "To Do"
-                    break
-
-            self.save_tasks_to_database()  # Save updated tasks to the database
-            self.update_task_tree()
+            task = self.tasks.get(selected_item[0])
+            if task and task.status != status:  # Nothing to save or redraw if the status is unchanged
+                task.status = status
+                self.queue_database_update({f'{task.key}/status': task.status})  # Save the updated status to the database
+                self.refresh_task_row(task)
         else:
-            messagebox.showwarning("Warning", "Please select a task to mark to do.")
+            messagebox.showwarning("Warning", f"Please select a task to mark {status.lower()}.")
 
     def delete_selected(self):
         selected_items = self.task_tree.selection()
         if selected_items:
+            deleted = {}
             for item in selected_items:
-                task_name = self.task_tree.item(item)['values'][0]
-                deadline = self.task_tree.item(item)['values'][1]
-                for task in self.tasks:
-                    if task.name == task_name and task.deadline == deadline:
-                        self.tasks.remove(task)
-                        break
-            self.save_tasks_to_database()  # Save updated tasks to the database
-            self.update_task_tree()
+                task = self.tasks.pop(item, None)
+                if task:
+                    deleted[task.key] = None  # A None value deletes the task node
+            if deleted:
+                self.queue_database_update(deleted)  # Delete all selected tasks in a single update
+            self.task_tree.delete(*selected_items)
+            for item in selected_items:
+                self.row_values.pop(item, None)
         else:
             messagebox.showwarning("Warning", "Please select tasks to delete.")
 
+    def run_in_background(self, func, callback, *args):
+        # Run func on the worker thread and pass its future to callback on the Tk main thread
+        future = self.io_pool.submit(func, *args)
+        self.master.after(POLL_INTERVAL_MS, self.poll_future, future, callback)
+        return future
+
+    def poll_future(self, future, callback):
+        # Tk widgets must only be touched from the main thread, so poll instead of using a done-callback
+        if self.closing:
+            return  # on_close handles the last results itself
+        if future.done():
+            callback(future)
+        else:
+            self.master.after(POLL_INTERVAL_MS, self.poll_future, future, callback)
+
+    def on_tasks_loaded(self, future):
+        try:
+            tasks, self.synced_at, orphan_keys = future.result()
+        except Exception as e:
+            self.unsynced_keys = None
+            logging.error(f"Failed to load tasks from the database: {e}")
+            messagebox.showerror("Error", f"Failed to load tasks from the database: {e}")
+            return
+        # Changes made while the load was in flight are written after it, so keep the local version of those tasks
+        for key in self.unsynced_keys:
+            if key in self.tasks:
+                tasks[key] = self.tasks[key]
+            else:
+                tasks.pop(key, None)
+        if self.unsynced_keys:
+            # Local tasks kept the server's position, so restore the order they were given locally (e.g. prioritised)
+            tasks = OrderedDict(sorted(tasks.items(), key=lambda item: item[1].order))
+        self.unsynced_keys = None
+        self.tasks = tasks
+        self.update_task_tree()
+        self.write_cache_in_background()
+        if orphan_keys:
+            # build_tasks skipped these; delete them so later loads don't fetch and skip them again
+            self.queue_database_update({key: None for key in orphan_keys})
+
+    def on_save_finished(self, future):
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save tasks to the database: {e}")
+
     def update_task_tree(self):
-        self.task_tree.delete(*self.task_tree.get_children())
-        for task in self.tasks:
-            self.task_tree.insert("", tk.END, values=(task.name, task.deadline, task.status))
+        # Reconcile the treeview with self.tasks, touching only rows that were added, removed, changed or moved
+        rows = self.task_tree.get_children()
+        if not rows:
+            # Fill an empty tree in batches
+            self.pending_rows = deque(self.tasks)
+            self.insert_pending_rows()
+            return
+        self.pending_rows.clear()  # Any rows still queued are inserted below
+
+        stale_rows = [iid for iid in rows if iid not in self.tasks]
+        if stale_rows:
+            self.task_tree.delete(*stale_rows)
+            for iid in stale_rows:
+                self.row_values.pop(iid, None)
+
+        for task in self.tasks.values():
+            if task.key in self.row_values:
+                self.refresh_task_row(task)
+            else:
+                self.insert_task_row(task)
+
+        # Only reposition rows if the order no longer matches
+        if self.task_tree.get_children() != tuple(self.tasks):
+            for index, key in enumerate(self.tasks):
+                self.task_tree.move(key, "", index)
+
+    def insert_pending_rows(self):
+        # Insert rows in batches from the event loop so a large task list doesn't freeze the window
+        for _ in range(min(TREE_BATCH_SIZE, len(self.pending_rows))):
+            task = self.tasks.get(self.pending_rows.popleft())
+            if task:  # Skip tasks deleted while the tree was being populated
+                self.insert_task_row(task)
+        if self.pending_rows:
+            self.master.after_idle(self.insert_pending_rows)
+
+    def insert_task_row(self, task):
+        values = (task.name, format_deadline(task.deadline), task.status)
+        self.task_tree.insert("", tk.END, iid=task.key, values=values)
+        self.row_values[task.key] = values
+
+    def refresh_task_row(self, task):
+        # Rewrite the row only if one of its displayed values changed
+        values = (task.name, format_deadline(task.deadline), task.status)
+        if self.row_values.get(task.key) != values:
+            self.task_tree.item(task.key, values=values)
+            self.row_values[task.key] = values
 
     def right_click_menu(self, event):
         # Select the item under the cursor
         item_id = self.task_tree.identify_row(event.y)
         if item_id:
-            # Create a right-click menu
-            menu = tk.Menu(self.master, tearoff=0)
-            menu.add_command(label="Prioritise Task", command=lambda: self.prioritise_task(item_id))
-            menu.post(event.x_root, event.y_root)
+            # Remember which row the menu was opened on and show the menu
+            self.context_menu_item = item_id
+            self.context_menu.post(event.x_root, event.y_root)
+
+    def prioritise_context_item(self):
+        if self.context_menu_item:
+            self.prioritise_task(self.context_menu_item)
 
     def prioritise_task(self, item_id):
-        # Get the task details from the item ID
-        task_details = self.task_tree.item(item_id)['values']
-        task_name = task_details[0]
-        deadline = task_details[1]
-        status = task_details[2]
-
-        # Find the task object
-        task = next((t for t in self.tasks if t.name == task_name and t.deadline == deadline and t.status == status), None)
-
-        if task:
-            # Remove the task from the list
-            self.tasks.remove(task)
-
-            # Insert the task at the beginning of the list and update the order values
-            task.order = 0
-            for i, t in enumerate(self.tasks):
-                t.order = i + 1
-            self.tasks.insert(0, task)
-
-            # Save updated tasks to the database
+        # Find the task object from the item ID
+        task = self.tasks.get(item_id)
+
+        first_task = next(iter(self.tasks.values()), None)
+        if task and task is not first_task:
+            # Order the task just before the current first task; order values don't need to be contiguous,
+            # so no other task has to be renumbered and only this task's order is saved
+            task.order = first_task.order - 1
+            self.tasks.move_to_end(task.key, last=False)
+            self.queue_database_update({f'{task.key}/order': task.order})
+
+            # Move the task's row to the top of the treeview
+            self.task_tree.move(task.key, "", 0)
+
+    def get_tasks_ref(self):
+        # Only called from the worker thread, which also takes the cost of initialising Firebase
+        if self.tasks_ref is None:
+            self.tasks_ref = get_firebase_db().reference(f'users/{self.username}/tasks')
+        return self.tasks_ref
+
+    def load_tasks_from_database(self, cached_data, synced_at):
+        # Fetch tasks from the user-specific directory; returns the tasks, the latest updated_at seen and the keys
+        # of nameless nodes to delete
+        tasks_ref = self.get_tasks_ref()
+        tasks_data = None
+        if synced_at is not None:
+            from firebase_admin.exceptions import FirebaseError
+            # Only download tasks changed since the last sync. The shallow read returns just the keys,
+            # which is enough to drop tasks deleted elsewhere and find tasks missing from the cache.
             try:
-                self.save_tasks_to_database()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save tasks to the database: {e}")
-
-            # Update the task treeview
-            self.update_task_tree()
-
-    def load_tasks_from_database(self):
-        # Fetch tasks from the user-specific directory
-        tasks_ref = db.reference(f'users/{self.username}/tasks')
-        tasks_data = tasks_ref.get()
-
-        tasks = []
-        if tasks_data:
-            for task_id, task_data in tasks_data.items():
-                name = task_data['name']
-                deadline = task_data['deadline']
-                status = task_data['status']
-                order = task_data.get('order', 0)  # Get the order value if it exists, default to 0
-                task = Task(name, deadline, status, order)
-                tasks.append(task)
-
-        tasks.sort(key=lambda x: x.order)  # Sort tasks based on order
-        return tasks
-
-    def save_tasks_to_database(self):
-        # Save tasks to the user-specific directory
-        tasks_ref = db.reference(f'users/{self.username}/tasks')
-        tasks_data = {task.name: {'name': task.name, 'deadline': task.deadline, 'status': task.status, 'order': task.order} for task in self.tasks}
+                keys = tasks_ref.get(shallow=True) or {}
+                changed_data = tasks_ref.order_by_child('updated_at').start_at(synced_at).get() or {}
+            except FirebaseError as e:
+                # The query is rejected unless the updated_at index from database.rules.json is deployed
+                logging.warning(f"Incremental task load failed, loading all tasks instead: {e}")
+            else:
+                tasks_data = {key: cached_data[key] for key in keys if key in cached_data}
+                tasks_data.update(changed_data)
+                for key in keys:
+                    if key not in tasks_data:
+                        tasks_data[key] = tasks_ref.child(key).get()
+        if tasks_data is None:
+            tasks_data = tasks_ref.get() or {}
+            changed_data = tasks_data
+
+        synced_at = max([synced_at or 0] + [data.get('updated_at', 0) for data in changed_data.values()
+                                            if isinstance(data, dict)])
+        # A field update to a task deleted on another device recreates it as a node with no name
+        orphan_keys = [key for key, data in tasks_data.items() if isinstance(data, dict) and 'name' not in data]
+        return build_tasks(tasks_data), synced_at, orphan_keys
+
+    def load_tasks_from_cache(self):
+        # Returns the cached {task key: task data} mapping and the updated_at it was synced up to
+        try:
+            with open(self.cache_file, 'rb') as file:
+                data = file.read()
+            cache = orjson.loads(data) if orjson else json.loads(data)
+            return cache['tasks'], cache['synced_at']
+        except FileNotFoundError:
+            return {}, None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable task cache {self.cache_file}: {e}")
+            return {}, None
+
+    def save_tasks_to_cache(self, tasks_data, synced_at):
+        if self.save_failed:
+            # The cache may hold changes the database never received, so make the next startup do a full load
+            synced_at = None
+        # Write to a temporary file first so a crash can't leave a half-written cache behind
+        temp_file = f'{self.cache_file}.tmp'
         try:
-            tasks_ref.set(tasks_data)
+            cache = {'synced_at': synced_at, 'tasks': tasks_data}
+            with open(temp_file, 'wb') as file:
+                file.write(orjson.dumps(cache) if orjson else json.dumps(cache).encode())
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            logging.error(f"Failed to save the task cache: {e}")
+
+    def write_cache_in_background(self):
+        tasks_data = {key: task.to_dict() for key, task in self.tasks.items()}
+        self.io_pool.submit(self.save_tasks_to_cache, tasks_data, self.synced_at)
+
+    def save_tasks_to_database(self, updates):
+        # Apply a multi-location update to the user-specific directory so only changed paths are sent.
+        # Keys are paths relative to the tasks node, e.g. '<task key>/status'; a None value deletes the path.
+        try:
+            self.get_tasks_ref().update(updates)
             logging.info(f"Tasks saved to the database for user {self.username}")
         except Exception as e:
             logging.error(f"Failed to save tasks to the database: {e}")
             raise e
 
+    def save_tasks(self, updates, tasks_data, synced_at):
+        # Runs on the worker thread; the cache is only updated once the database has accepted the changes
+        try:
+            self.save_tasks_to_database(updates)
+        except Exception:
+            self.save_failed = True
+            cached_data, _ = self.load_tasks_from_cache()
+            self.save_tasks_to_cache(cached_data, None)
+            raise
+        self.save_tasks_to_cache(tasks_data, synced_at)
+
+    def queue_database_update(self, updates):
+        # Merge the updates into the pending batch and (re)start the flush timer
+        for path, value in updates.items():
+            key, _, field = path.partition('/')
+            if self.unsynced_keys is not None:
+                self.unsynced_keys.add(key)
+            if not field:
+                # The whole task node is replaced or deleted, so earlier field updates are superseded
+                for pending_path in [p for p in self.pending_updates if p.startswith(f'{key}/')]:
+                    del self.pending_updates[pending_path]
+            elif key in self.pending_updates:
+                # Fold field updates into a pending whole-node write; updating a deleted task is a no-op
+                if self.pending_updates[key] is not None:
+                    self.pending_updates[key][field] = value
+                continue
+            self.pending_updates[path] = value
+
+        if self.flush_job is not None:
+            self.master.after_cancel(self.flush_job)
+        self.flush_job = self.master.after(SAVE_DELAY_MS, self.flush_database_updates)
+
+    def flush_database_updates(self):
+        # Send all pending updates to the database in a single write; returns the save's future, if any
+        if self.flush_job is not None:
+            self.master.after_cancel(self.flush_job)
+            self.flush_job = None
+        if not self.pending_updates:
+            return None
+        updates, self.pending_updates = self.pending_updates, {}
+
+        # Stamp every written task with the server time so other sessions can fetch only what changed
+        for key in {path.partition('/')[0] for path, value in updates.items() if value is not None}:
+            if key in updates:
+                updates[key]['updated_at'] = SERVER_TIMESTAMP
+            else:
+                updates[f'{key}/updated_at'] = SERVER_TIMESTAMP
+        tasks_data = {key: task.to_dict() for key, task in self.tasks.items()}
+        return self.run_in_background(self.save_tasks, self.on_save_finished, updates, tasks_data, self.synced_at)
+
+    def on_close(self):
+        # Queue the final updates and wait for the worker to finish writing them
+        future = self.flush_database_updates()
+        self.io_pool.shutdown(wait=True)
+        # Report a failed final save here, since the window is destroyed before the poll would see it
+        self.closing = True
+        if future is not None:
+            self.on_save_finished(future)
+        self.master.destroy()
+
     def clear_task_entry(self):
         self.task_entry.delete(0, tk.END)
         self.deadline_entry_date.set_date(datetime.today())
@@ -431,32 +740,43 @@ class TaskManager:
 
 
 class ToolTip:
-    def __init__(self, widget, text):
-        self.widget = widget
-        self.text = text
+    """A single tooltip window shared by every widget added to it"""
+    def __init__(self, master):
+        self.master = master
+        self.texts = {}  # Widget path -> tooltip text
         self.tooltip_window = None
-
-    def showtip(self):
+        self.label = None
+
+    def add_widget(self, widget, text):
+        self.texts[str(widget)] = text
+        widget.bind("<Enter>", self.showtip)
+        widget.bind("<Leave>", self.hidetip)
+
+    def showtip(self, event):
+        widget = event.widget
+        x, y, cx, cy = widget.bbox("insert")
+        x += widget.winfo_rootx() + 25
+        y += widget.winfo_rooty() + 25
         if not self.tooltip_window:
-            x, y, cx, cy = self.widget.bbox("insert")
-            x += self.widget.winfo_rootx() + 25
-            y += self.widget.winfo_rooty() + 25
-            self.tooltip_window = tw = tk.Toplevel(self.widget)
+            # Build the tooltip on the first hover, then reuse it for every widget
+            self.tooltip_window = tw = tk.Toplevel(self.master)
             tw.wm_overrideredirect(True)
-            tw.wm_geometry("+%d+%d" % (x, y))
-            label = tk.Label(tw, text=self.text, justify='left', bg='white', relief='solid', borderwidth=1,
-                             font=("Helvetica", 10, "normal"))
-            label.pack(ipadx=1)
-
-    def hidetip(self):
+            self.label = tk.Label(tw, justify='left', bg='white', relief='solid', borderwidth=1,
+                                  font=("Helvetica", 10, "normal"))
+            self.label.pack(ipadx=1)
+        self.label.config(text=self.texts[str(widget)])
+        self.tooltip_window.wm_geometry("+%d+%d" % (x, y))
+        self.tooltip_window.deiconify()
+
+    def hidetip(self, event=None):
         if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+            self.tooltip_window.withdraw()
 
 
 def main():
-    login_screen = LoginScreen()
-    login_screen.mainloop()
+    root = tk.Tk()
+    LoginScreen(root)
+    root.mainloop()
 
 
 if __name__ == "__main__":